@@ -1,138 +1,479 @@
+import ctypes
+import functools
+import math
+import os
+import threading
+from dataclasses import dataclass
+
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, apply_transform falls back to NumPy
+    njit = None
+
+try:
+    import cupy
+except ImportError:  # CuPy is optional, only needed for device='cuda'
+    cupy = None
+
+
+# Default element type for every matrix; float32 is plenty for plotting and
+# halves the memory traffic compared to float64
+_DTYPE = np.float32
+
+
+def _frozen(rows):
+    """Build a read-only matrix that can be shared between callers"""
+    matrix = np.array(rows, dtype=_DTYPE)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _to_device(matrix, device):
+    """Return a CPU-built matrix on the requested device ('cpu' or 'cuda')"""
+    if device == 'cpu':
+        return matrix
+    if device == 'cuda':
+        if cupy is None:
+            raise ImportError("device='cuda' requires CuPy to be installed")
+        return cupy.asarray(matrix)
+    raise ValueError(f"device must be 'cpu' or 'cuda', not {device!r}")
+
+
+def _array_namespace(*arrays):
+    """Return the array module (numpy or cupy) the arrays live in"""
+    if cupy is None:
+        return np
+    return cupy.get_array_module(*arrays)
+
+
+# Constant reflection matrices, built once at import time
+_REFLECT_X_3D = _frozen([[1, 0, 0, 0], [0, -1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]])
+_REFLECT_Y_3D = _frozen([[-1, 0, 0, 0], [0, 1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]])
+_REFLECT_ORIGIN_3D = _frozen([[-1, 0, 0, 0], [0, -1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]])
+
+# Filled in by Transform3D.combined_transform() on first use
+_COMBINED = None
+
+
+def _is_affine(matrix):
+    """Check whether a matrix (or every matrix in a stack) ends in [0, 0, 0, 1]"""
+    # tolist() on the single-matrix case is much cheaper than np.all()
+    if matrix.ndim == 2:
+        return matrix[-1].tolist() == [0, 0, 0, 1]
+    return bool((matrix[:, -1, :-1] == 0).all() and (matrix[:, -1, -1] == 1).all())
+
+
+# Below this many points apply_transform hands single affine matrices on
+# (3, N) float arrays to the fused Numba kernel. It only saves a few hundred
+# ns over R @ points + t, so every caller must check shapes first: the
+# kernel does no bounds checking.
+_NUMBA_MAX_POINTS = 64
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _apply_affine_3d(R, t, pts, out):
+        for n in range(pts.shape[1]):
+            for i in range(3):
+                s = t[i]
+                for j in range(3):
+                    s += R[i, j] * pts[j, n]
+                out[i, n] = s
+else:
+    _apply_affine_3d = None
+
+
+def _load_affine_lib():
+    """Load the optional compiled kernel from _affine.c, if it has been built"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_affine.so')
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+    array_f32 = np.ctypeslib.ndpointer(dtype=np.float32, flags='C_CONTIGUOUS')
+    lib.affine3.argtypes = [array_f32, array_f32, array_f32, array_f32, ctypes.c_size_t]
+    lib.affine3.restype = None
+    try:
+        batch = lib.affine3_batch
+    except AttributeError:
+        # Built from an older _affine.c; affine3 alone is still usable
+        lib.affine3_batch = None
+        return lib
+    pointer_array = ctypes.POINTER(ctypes.c_void_p)
+    batch.argtypes = [array_f32, array_f32, pointer_array, pointer_array,
+                      np.ctypeslib.ndpointer(dtype=np.uintp), ctypes.c_size_t]
+    batch.restype = None
+    return lib
+
+
+_AFFINE_LIB = _load_affine_lib()
+
+# While the points fit in cache BLAS beats the per-point C loop (the ctypes
+# call alone costs ~12us): NumPy was ~1.7x faster at 65k points and level
+# around 128k. From 2**18 points the kernel was typically 1.1-1.5x faster
+_C_MIN_POINTS = 262144
+
+
 class Transform3D:
     """3D Transformation Matrix Operations"""
     
+    # Homogeneous (4, N) buffer reused by apply_transform between calls.
+    # Each thread gets its own, kept alive until that thread calls reset_scratch
+    _scratch = threading.local()
+    
+    @staticmethod
+    def translation(tx, ty, tz, dtype=_DTYPE, device='cpu'):
+        matrix = np.eye(4, dtype=dtype)
+        matrix[0, 3] = tx
+        matrix[1, 3] = ty
+        matrix[2, 3] = tz
+        return _to_device(matrix, device)
+    
     @staticmethod
-    def translation(tx, ty, tz):
-        return np.array([
-            [1, 0, 0, tx],
-            [0, 1, 0, ty],
-            [0, 0, 1, tz],
-            [0, 0, 0, 1]
-        ])
+    def rotation_x(angle_degrees, dtype=_DTYPE, device='cpu'):
+        theta = math.radians(angle_degrees)
+        c, s = math.cos(theta), math.sin(theta)
+        matrix = np.eye(4, dtype=dtype)
+        matrix[1, 1] = c
+        matrix[1, 2] = -s
+        matrix[2, 1] = s
+        matrix[2, 2] = c
+        return _to_device(matrix, device)
     
     @staticmethod
-    def rotation_x(angle_degrees):
-        theta = np.radians(angle_degrees)
-        return np.array([
-            [1, 0, 0, 0],
-            [0, np.cos(theta), -np.sin(theta), 0],
-            [0, np.sin(theta), np.cos(theta), 0],
-            [0, 0, 0, 1]
-        ])
+    def rotation_x_batch(angles_degrees, dtype=_DTYPE, device='cpu'):
+        # One rotation_x per angle, stacked as (B, 4, 4)
+        angles = np.remainder(np.asarray(angles_degrees, dtype=np.float64).ravel(), 360)
+        theta = np.radians(angles).astype(dtype, copy=False)
+        matrices = np.zeros((theta.size, 4, 4), dtype=dtype)
+        matrices[:, 0, 0] = 1
+        np.cos(theta, out=matrices[:, 1, 1])
+        np.sin(theta, out=matrices[:, 2, 1])
+        matrices[:, 2, 2] = matrices[:, 1, 1]
+        np.negative(matrices[:, 2, 1], out=matrices[:, 1, 2])
+        matrices[:, 3, 3] = 1
+        return _to_device(matrices, device)
     
     @staticmethod
-    def scaling(sx, sy, sz):
-        return np.array([
-            [sx, 0, 0, 0],
-            [0, sy, 0, 0],
-            [0, 0, sz, 0],
-            [0, 0, 0, 1]
-        ])
+    def scaling(sx, sy, sz, dtype=_DTYPE, device='cpu'):
+        matrix = np.eye(4, dtype=dtype)
+        matrix[0, 0] = sx
+        matrix[1, 1] = sy
+        matrix[2, 2] = sz
+        return _to_device(matrix, device)
     
     @staticmethod
-    def shear_x(shx):
-        return np.array([
-            [1, shx, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, 1]
-        ])
+    def shear_x(shx, dtype=_DTYPE, device='cpu'):
+        matrix = np.eye(4, dtype=dtype)
+        matrix[0, 1] = shx
+        return _to_device(matrix, device)
     
     @staticmethod
-    def reflection_x():
-        return np.array([
-            [1, 0, 0, 0],
-            [0, -1, 0, 0],
-            [0, 0, -1, 0],
-            [0, 0, 0, 1]
-        ])
+    def reflection_x(dtype=_DTYPE, device='cpu'):
+        return _to_device(_REFLECT_X_3D.astype(dtype, copy=False), device)
 
     @staticmethod
-    def reflection_y():
-        return np.array([
-            [-1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, -1, 0],
-            [0, 0, 0, 1]
-        ])
+    def reflection_y(dtype=_DTYPE, device='cpu'):
+        return _to_device(_REFLECT_Y_3D.astype(dtype, copy=False), device)
 
     @staticmethod
-    def reflection_origin():
-        return np.array([
-            [-1, 0, 0, 0],
-            [0, -1, 0, 0],
-            [0, 0, -1, 0],
-            [0, 0, 0, 1]
-        ])
+    def reflection_origin(dtype=_DTYPE, device='cpu'):
+        return _to_device(_REFLECT_ORIGIN_3D.astype(dtype, copy=False), device)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def translation_cached(tx, ty, tz, dtype=_DTYPE):
+        # Memoized, read-only translation() for repeated identical arguments
+        matrix = Transform3D.translation(tx, ty, tz, dtype)
+        matrix.flags.writeable = False
+        return matrix
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def rotation_x_cached(angle_degrees, dtype=_DTYPE):
+        matrix = Transform3D.rotation_x(angle_degrees, dtype)
+        matrix.flags.writeable = False
+        return matrix
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def scaling_cached(sx, sy, sz, dtype=_DTYPE):
+        matrix = Transform3D.scaling(sx, sy, sz, dtype)
+        matrix.flags.writeable = False
+        return matrix
     
     @staticmethod
     def combined_transform():
-        """Example: Combined Translation + Rotation X + Scaling"""
-        return Transform3D.translation(1, 1, 0.5) @ Transform3D.rotation_x(30) @ Transform3D.scaling(1.2, 0.8, 1.5)
+        """Example: Combined Translation + Rotation X + Scaling
+        
+        The product is constant, so it is computed on the first call and the
+        same read-only matrix is returned afterwards.
+        """
+        global _COMBINED
+        if _COMBINED is None:
+            combined = Affine.from_translation(1, 1, 0.5) @ Affine.from_rotation_x(30) @ Affine.from_scaling(1.2, 0.8, 1.5)
+            _COMBINED = combined.matrix()
+            _COMBINED.flags.writeable = False
+        return _COMBINED
+    
+    @staticmethod
+    def apply_transform(points, matrix, out=None):
+        # matrix may be a single 4x4 or a (B, 4, 4) stack -> result (B, 3, N).
+        # CuPy inputs skip the CPU kernels and run the NumPy expressions on GPU.
+        # A preallocated out of the result's shape is filled and returned.
+        xp = _array_namespace(points, matrix)
+        if _is_affine(matrix):
+            # The compiled kernels write out as they read points, so they only
+            # take an out of exactly the result's shape that does not overlap
+            # points; anything else goes through matmul, which handles both
+            compiled = (xp is np and matrix.ndim == 2
+                        and points.ndim == 2 and points.shape[0] == 3
+                        and (out is None or (out.shape == points.shape
+                                             and not np.shares_memory(out, points))))
+            if (_apply_affine_3d is not None and compiled
+                    and points.shape[1] < _NUMBA_MAX_POINTS
+                    and (out is None or out.dtype == np.result_type(matrix, points))):
+                if out is None:
+                    out = np.empty(points.shape, dtype=np.result_type(matrix, points))
+                _apply_affine_3d(matrix[:3, :3], matrix[:3, 3], points, out)
+                return out
+            if (_AFFINE_LIB is not None and compiled
+                    and points.shape[1] >= _C_MIN_POINTS
+                    and matrix.dtype == points.dtype == np.float32
+                    and points.flags['C_CONTIGUOUS']
+                    and (out is None or (out.dtype == np.float32 and out.flags['C_CONTIGUOUS']))):
+                if out is None:
+                    out = np.empty_like(points)
+                _AFFINE_LIB.affine3(np.ascontiguousarray(matrix[:3, :3]),
+                                    np.ascontiguousarray(matrix[:3, 3]),
+                                    points, out, points.shape[1])
+                return out
+            transformed = xp.matmul(matrix[..., :3, :3], points, out=out)
+            transformed += matrix[..., :3, 3:4]
+            return transformed
+        homogeneous = Transform3D._homogeneous(points, xp)
+        # Only the three kept rows are computed. matmul beat np.einsum (with
+        # or without optimize=True) for N = 8..100k
+        return xp.matmul(matrix[..., :3, :], homogeneous, out=out)
     
     @staticmethod
-    def apply_transform(points, matrix):
-        ones = np.ones((1, points.shape[1]))
-        homogeneous = np.vstack([points, ones])
-        transformed = matrix @ homogeneous
-        return transformed[:3, :]
+    def apply_transform_batch(Rs, ts, point_arrays):
+        # Transform mesh i as Rs[i] @ point_arrays[i] + ts[i]; meshes may differ
+        # in size. With the compiled kernel, float32 meshes are processed in
+        # parallel across cores with the GIL released.
+        point_arrays = [np.ascontiguousarray(points) for points in point_arrays]
+        count = len(point_arrays)
+        if len(Rs) != count or len(ts) != count:
+            raise ValueError(f"Got {len(Rs)} rotations and {len(ts)} translations for {count} meshes")
+        for points in point_arrays:
+            if points.ndim != 2 or points.shape[0] != 3:
+                raise ValueError(f"Each mesh must have shape (3, n), got {points.shape}")
+        if (_AFFINE_LIB is None or _AFFINE_LIB.affine3_batch is None
+                or any(points.dtype != np.float32 for points in point_arrays)):
+            Rs, ts = np.asarray(Rs), np.asarray(ts)
+            return [R @ points + t[:, None] for R, t, points in zip(Rs, ts, point_arrays)]
+        Rs = np.ascontiguousarray(Rs, dtype=np.float32).reshape(count, 3, 3)
+        ts = np.ascontiguousarray(ts, dtype=np.float32).reshape(count, 3)
+        outs = [np.empty_like(points) for points in point_arrays]
+        sizes = np.array([points.shape[1] for points in point_arrays], dtype=np.uintp)
+        pointers = ctypes.c_void_p * count
+        _AFFINE_LIB.affine3_batch(Rs, ts,
+                                  pointers(*[points.ctypes.data for points in point_arrays]),
+                                  pointers(*[out.ctypes.data for out in outs]),
+                                  sizes, count)
+        return outs
+    
+    @staticmethod
+    def _homogeneous(points, xp=np):
+        if xp is not np:
+            ones = xp.ones((1, points.shape[1]), dtype=points.dtype)
+            return xp.concatenate([points, ones])
+        shape = (points.shape[0] + 1, points.shape[1])
+        scratch = getattr(Transform3D._scratch, 'buffer', None)
+        if scratch is None or scratch.shape != shape or scratch.dtype != points.dtype:
+            scratch = Transform3D._scratch.buffer = np.empty(shape, dtype=points.dtype)
+            # Nothing else writes the last row, so fill the ones only once
+            scratch[-1] = 1
+        scratch[:-1] = points
+        return scratch
+    
+    @staticmethod
+    def reset_scratch():
+        Transform3D._scratch.buffer = None
 
 
-def plot_cube(ax, cube, edges, color, linestyle='-', label=None):
-    for edge in edges:
-        pts = cube[:, edge]
-        ax.plot3D(pts[0], pts[1], pts[2], color=color, linestyle=linestyle, linewidth=2, label=label if edge == edges[0] else "")
+@dataclass
+class Affine:
+    """3D affine transform kept as a linear part R (3x3) and translation t (3,)
+    
+    Composition follows (R1, t1) @ (R2, t2) = (R1 @ R2, R1 @ t2 + t1), so a
+    chain of affines never pays for the constant homogeneous row and column.
+    """
+    R: np.ndarray
+    t: np.ndarray
+    
+    @classmethod
+    def from_matrix(cls, matrix):
+        return cls(matrix[:3, :3].copy(), matrix[:3, 3].copy())
+    
+    @classmethod
+    def from_translation(cls, tx, ty, tz, dtype=_DTYPE):
+        return cls(np.eye(3, dtype=dtype), np.array([tx, ty, tz], dtype=dtype))
+    
+    @classmethod
+    def from_rotation_x(cls, angle_degrees, dtype=_DTYPE):
+        return cls.from_matrix(Transform3D.rotation_x(angle_degrees, dtype))
+    
+    @classmethod
+    def from_scaling(cls, sx, sy, sz, dtype=_DTYPE):
+        return cls(np.diag(np.array([sx, sy, sz], dtype=dtype)), np.zeros(3, dtype=dtype))
+    
+    def __matmul__(self, other):
+        if not isinstance(other, Affine):
+            return NotImplemented
+        return Affine(self.R @ other.R, self.R @ other.t + self.t)
+    
+    def apply(self, points):
+        if (_apply_affine_3d is not None and isinstance(points, np.ndarray)
+                and points.ndim == 2 and points.shape[0] == 3
+                and points.shape[1] < _NUMBA_MAX_POINTS):
+            out = np.empty(points.shape, dtype=np.result_type(self.R, points))
+            _apply_affine_3d(self.R, self.t, points, out)
+            return out
+        return self.R @ points + self.t[:, None]
+    
+    def matrix(self):
+        """Return the equivalent 4x4 homogeneous matrix"""
+        matrix = np.eye(4, dtype=np.result_type(self.R, self.t))
+        matrix[:3, :3] = self.R
+        matrix[:3, 3] = self.t
+        return matrix
 
 
-def demo_3d_transformations():
-    cube = np.array([
-        [0, 1, 1, 0, 0, 1, 1, 0],
-        [0, 0, 1, 1, 0, 0, 1, 1],
-        [0, 0, 0, 0, 1, 1, 1, 1]
-    ])
-    
-    edges = [
-        [0, 1], [1, 2], [2, 3], [3, 0],
-        [4, 5], [5, 6], [6, 7], [7, 4],
-        [0, 4], [1, 5], [2, 6], [3, 7]
-    ]
+class TransformContext:
+    """Preallocated buffers for transforming N points over and over
     
+    apply() writes into the same (3, N) output every time, so an animation
+    loop does no allocation at all. The returned array is overwritten by
+    the next call; copy it if it has to outlive the frame. Passing self.out
+    back in as points is supported and transforms it in place.
+    """
+    
+    def __init__(self, n_points, dtype=_DTYPE):
+        self.homogeneous = np.ones((4, n_points), dtype=dtype)
+        self.out = np.empty((3, n_points), dtype=dtype)
+    
+    def apply(self, points, matrix):
+        """Transform (3, N) points by a single 4x4 matrix into self.out"""
+        if points.shape != self.out.shape:
+            raise ValueError(f"Expected points of shape {self.out.shape}, got {points.shape}")
+        if _is_affine(matrix):
+            return Transform3D.apply_transform(points, matrix, out=self.out)
+        self.homogeneous[:-1] = points
+        return np.matmul(matrix[:3], self.homogeneous, out=self.out)
+
+
+# Unit cube and its twelve edges used by the demo figure
+_CUBE = np.array([
+    [0, 1, 1, 0, 0, 1, 1, 0],
+    [0, 0, 1, 1, 0, 0, 1, 1],
+    [0, 0, 0, 0, 1, 1, 1, 1]
+], dtype=_DTYPE)
+
+_EDGES = np.array([
+    [0, 1], [1, 2], [2, 3], [3, 0],
+    [4, 5], [5, 6], [6, 7], [7, 4],
+    [0, 4], [1, 5], [2, 6], [3, 7]
+])
+
+# (key, subplot title) for each panel of the 2x3 demo grid
+_PANELS = [
+    ('translation', 'Translation (2,1,0.5)'),
+    ('rotation_x', 'Rotation X-axis (45°)'),
+    ('scaling', 'Scaling (2,2,1.5)'),
+    ('shear_x', 'Shearing (Shx=2)'),
+    ('reflection_origin', 'Reflection Through Origin'),
+    ('combined', 'Combined Transformation'),
+]
+
+
+def _cube_polyline(cube, edges):
+    # All edges as one polyline: matplotlib breaks the line at the NaNs
+    edges = np.asarray(edges)
+    segments = np.full((3, len(edges), 3), np.nan, dtype=np.result_type(cube.dtype, np.float32))
+    segments[:, :, 0] = cube[:, edges[:, 0]]
+    segments[:, :, 1] = cube[:, edges[:, 1]]
+    return segments.reshape(3, -1)
+
+
+def plot_cube(ax, cube, edges, color, linestyle='-', label=None):
+    # Draw every edge with a single artist and return it for later updates
+    xs, ys, zs = _cube_polyline(cube, edges)
+    line, = ax.plot3D(xs, ys, zs, color=color, linestyle=linestyle, linewidth=2, label=label)
+    return line
+
+
+def _decorate(ax):
+    ax.set_xlabel('X', labelpad=12)
+    ax.set_ylabel('Y', labelpad=12)
+    ax.set_zlabel('Z', labelpad=12)
+
+
+def _build_axes():
+    # Create the demo figure once; lines maps each panel key to its
+    # 'Transformed' artist so update_frame() can refresh it in place
     fig = plt.figure(figsize=(20, 14))
     fig.suptitle('3D Transformations (Original: Blue, Transformed: Red)', 
                  fontsize=18, fontweight='bold', y=0.985)
     
-    def plot_with_original(ax, transform_matrix, title):
-        transformed = Transform3D.apply_transform(cube, transform_matrix)
-        plot_cube(ax, cube, edges, 'blue', '-', label='Original')
-        plot_cube(ax, transformed, edges, 'red', '-', label='Transformed')
+    axes = []
+    lines = {}
+    for i, (key, title) in enumerate(_PANELS, start=1):
+        ax = fig.add_subplot(2, 3, i, projection='3d')
+        plot_cube(ax, _CUBE, _EDGES, 'blue', '-', label='Original')
+        lines[key] = plot_cube(ax, _CUBE, _EDGES, 'red', '-', label='Transformed')
         ax.legend(loc='upper right', fontsize=9)
         ax.set_title(title, pad=25, fontsize=12)
-        ax.set_xlim([-3, 3]); ax.set_ylim([-3, 3]); ax.set_zlim([-3, 3])
-        ax.set_xlabel('X', labelpad=12)
-        ax.set_ylabel('Y', labelpad=12)
-        ax.set_zlabel('Z', labelpad=12)
-    
-    ax1 = fig.add_subplot(2, 3, 1, projection='3d')
-    plot_with_original(ax1, Transform3D.translation(2, 1, 0.5), 'Translation (2,1,0.5)')
+        _decorate(ax)
+        axes.append(ax)
     
-    ax2 = fig.add_subplot(2, 3, 2, projection='3d')
-    plot_with_original(ax2, Transform3D.rotation_x(45), 'Rotation X-axis (45°)')
+    # Same view for every panel
+    plt.setp(axes, xlim=(-3, 3), ylim=(-3, 3), zlim=(-3, 3))
     
-    ax3 = fig.add_subplot(2, 3, 3, projection='3d')
-    plot_with_original(ax3, Transform3D.scaling(2, 2, 1.5), 'Scaling (2,2,1.5)')
-    
-    ax4 = fig.add_subplot(2, 3, 4, projection='3d')
-    plot_with_original(ax4, Transform3D.shear_x(2), 'Shearing (Shx=2)')
+    return fig, axes, lines
+
+
+def update_frame(fig, lines, t):
+    """Move every panel to progress t (0 = identity, 1 = the full transform)
     
-    ax5 = fig.add_subplot(2, 3, 5, projection='3d')
-    plot_with_original(ax5, Transform3D.reflection_origin(), 'Reflection Through Origin')
+    Only the existing artists are updated, so this is cheap enough to drive a
+    matplotlib animation.
+    """
+    rotation_45, rotation_30 = Transform3D.rotation_x_batch([45 * t, 30 * t])
+    matrices = {
+        'translation': Transform3D.translation(2 * t, t, 0.5 * t),
+        'rotation_x': rotation_45,
+        'scaling': Transform3D.scaling(1 + t, 1 + t, 1 + 0.5 * t),
+        'shear_x': Transform3D.shear_x(2 * t),
+        'reflection_origin': Transform3D.scaling(1 - 2 * t, 1 - 2 * t, 1 - 2 * t),
+        # Reaches combined_transform() at t = 1
+        'combined': (Transform3D.translation(t, t, 0.5 * t) @ rotation_30
+                     @ Transform3D.scaling(1 + 0.2 * t, 1 - 0.2 * t, 1 + 0.5 * t)),
+    }
     
-    ax6 = fig.add_subplot(2, 3, 6, projection='3d')
-    plot_with_original(ax6, Transform3D.combined_transform(), 'Combined Transformation')
+    # Transform the cube by all six matrices in a single batched call
+    results = Transform3D.apply_transform(_CUBE, np.stack(list(matrices.values())))
+    for key, transformed in zip(matrices, results):
+        lines[key].set_data_3d(*_cube_polyline(transformed, _EDGES))
+    fig.canvas.draw_idle()
+
+
+def demo_3d_transformations():
+    fig, axes, lines = _build_axes()
+    update_frame(fig, lines, 1.0)
     
     plt.tight_layout(rect=[0, 0.01, 1, 0.96], h_pad=5, w_pad=3)
     plt.subplots_adjust(hspace=0.4, wspace=0.3)
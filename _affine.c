@@ -0,0 +1,54 @@
+/*
+ * Fused 3D affine transform kernel used by 3DTransformation.py.
+ *
+ * Points are stored the same way as in the Python code: a C-contiguous
+ * (3, n) float32 array, i.e. all x's, then all y's, then all z's.  The 3x3
+ * linear part is row-major and t is the translation column.
+ *
+ * Build (the Python side loads _affine.so from this directory if present):
+ *
+ *     gcc -O3 -march=native -ffast-math -fopenmp -shared -fPIC _affine.c -o _affine.so
+ *
+ * Both loops are OpenMP-parallel; the thread count follows OMP_NUM_THREADS.
+ * Without -fopenmp the pragmas are ignored and the kernels run serially.
+ */
+#include <stddef.h>
+
+void affine3(const float R[9], const float t[3],
+             const float *restrict pts, float *restrict out, size_t n)
+{
+    const float r00 = R[0], r01 = R[1], r02 = R[2];
+    const float r10 = R[3], r11 = R[4], r12 = R[5];
+    const float r20 = R[6], r21 = R[7], r22 = R[8];
+    const float t0 = t[0], t1 = t[1], t2 = t[2];
+
+    const float *restrict x = pts;
+    const float *restrict y = pts + n;
+    const float *restrict z = pts + 2 * n;
+    float *restrict ox = out;
+    float *restrict oy = out + n;
+    float *restrict oz = out + 2 * n;
+
+    #pragma omp parallel for schedule(static)
+    for (ptrdiff_t i = 0; i < (ptrdiff_t)n; ++i) {
+        const float xi = x[i], yi = y[i], zi = z[i];
+        ox[i] = r00 * xi + r01 * yi + r02 * zi + t0;
+        oy[i] = r10 * xi + r11 * yi + r12 * zi + t1;
+        oz[i] = r20 * xi + r21 * yi + r22 * zi + t2;
+    }
+}
+
+/*
+ * Transform m independent meshes: mesh k uses Rs[9k..9k+8], ts[3k..3k+2] and
+ * the (3, ns[k]) arrays pts[k] -> outs[k].  Meshes are spread over threads;
+ * the per-mesh loop above then runs serially inside each one.
+ */
+void affine3_batch(const float *Rs, const float *ts,
+                   const float *const *pts, float *const *outs,
+                   const size_t *ns, size_t m)
+{
+    #pragma omp parallel for schedule(dynamic)
+    for (ptrdiff_t k = 0; k < (ptrdiff_t)m; ++k) {
+        affine3(Rs + 9 * k, ts + 3 * k, pts[k], outs[k], ns[k]);
+    }
+}